@@ -4,14 +4,234 @@ LeekDuck Events to iCalendar Scraper
 Scrapes Pokemon GO events from LeekDuck and generates an iCalendar file
 """
 
-import requests
-from bs4 import BeautifulSoup
-from datetime import datetime, timedelta
-from icalendar import Calendar, Event, Alarm
-import pytz
-from typing import List, Dict, Optional
+import asyncio
+import hashlib
+import html as html_lib
+import json
+import logging
+import httpx
+from selectolax.lexbor import LexborHTMLParser
+from functools import lru_cache
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+from typing import Iterator, List, Dict, Optional, Tuple
 import re
-import time
+
+
+logger = logging.getLogger(__name__)
+
+# Date formats used by LeekDuck, e.g. "Monday, October 13, 2025, at 6:00 PM"
+# and "Mon, Oct 13, at 7:00 PM"
+_DATE_WITH_YEAR_RE = re.compile(r'(\w+),\s+(\w+)\s+(\d+),\s+(\d{4}),\s+at\s+(\d+):(\d+)\s+(AM|PM)')
+_DATE_SHORT_RE = re.compile(r'(\w+),\s+(\w+)\s+(\d+),\s+at\s+(\d+):(\d+)\s+(AM|PM)')
+
+# Month numbers by lowercased full and abbreviated English month name
+_MONTHS = {
+    name: number
+    for number, full_name in enumerate(
+        ('january', 'february', 'march', 'april', 'may', 'june', 'july',
+         'august', 'september', 'october', 'november', 'december'),
+        start=1
+    )
+    for name in (full_name, full_name[:3])
+}
+_MONTHS['sept'] = 9
+
+# Full date as shown on event detail pages, e.g.
+# "Tuesday, October 7, 2025, at 10:00 AM"
+_FULL_DATE = r'[A-Za-z]+,\s+[A-Za-z]+\s+\d+,\s+\d{4},\s+at\s+\d+:\d+\s+[AP]M'
+
+# Date patterns searched for in the text of an event detail page (use \s+
+# to handle variable whitespace)
+# "Starts: DATE Local Time" (or "Start:") and "Ends: DATE Local Time" (or "End:")
+_START_DATE_RE = re.compile(rf'Starts?:\s+({_FULL_DATE})\s+Local\s+Time', re.IGNORECASE)
+_END_DATE_RE = re.compile(rf'Ends?:\s+({_FULL_DATE})\s+Local\s+Time', re.IGNORECASE)
+# Any "DATE Local Time"
+_LOCAL_DATE_RE = re.compile(rf'({_FULL_DATE})\s+Local\s+Time')
+# "from DATE to DATE at TIME" with full dates
+_DATE_RANGE_RE = re.compile(
+    r'from\s+[A-Za-z]+,\s+[A-Za-z]+\s+\d+,\s+\d{4}\s+to\s+([A-Za-z]+,\s+[A-Za-z]+\s+\d+,\s+\d{4}),?\s+at\s+(\d+:\d+\s+[AP]M)',
+    re.IGNORECASE
+)
+# "from Month Day, Year to Month Day, Year" (no time)
+_DATE_RANGE_NO_TIME_RE = re.compile(
+    r'from\s+([A-Za-z]+\s+\d+,\s+\d{4})\s+to\s+([A-Za-z]+\s+\d+,\s+\d{4})',
+    re.IGNORECASE
+)
+
+# Links from the listing page to event detail pages, e.g. "/events/raid-hour/"
+_EVENT_HREF_RE = re.compile(r'/events/[^/]{3,}')
+# Same links (href and inner HTML), found in the raw listing HTML. Comments
+# and script/style/template blocks are matched too, so that links inside
+# them are skipped (no href group).
+_LISTING_LINK_RE = re.compile(
+    rb'<!--.*?-->'
+    rb'|<(?P<skip>script|style|template)\b.*?</(?P=skip)\s*>'
+    rb'|<a\s[^>]*?(?<![-\w:])href=["\'](?P<href>/events/[^"\'>]+)[^>]*>(?P<text>.*?)</a\s*>',
+    re.IGNORECASE | re.DOTALL
+)
+# Tags in a link's inner HTML
+_TAG_RE = re.compile(r'<[^>]*>')
+
+# Main content containers on event detail pages. The description comes
+# from the first one that has paragraphs, tried in this order; dates are
+# searched for in the text of the first of _DATES_SELECTORS found.
+_DESCRIPTION_SELECTORS = (
+    'div.entry-content',
+    'div.event-description',
+    'div.content',
+    'article',
+    'main'
+)
+_DATES_SELECTORS = ('article', 'main', 'div.entry-content')
+_CONTAINERS_SELECTOR = ', '.join(_DESCRIPTION_SELECTORS)
+
+# Common suffixes appended to page titles (" - Leek Duck ..." and
+# " | Pokémon GO ..."), removed from the first one found to the end
+_TITLE_SUFFIX_RE = re.compile(r'\s*(?:-\s*Leek Duck|\|\s*Pokémon GO).*$')
+
+# Event title keywords (matched against the casefolded title) and their
+# icons. Order matters - the first rule with a keyword in the title wins, so
+# more specific rules come first.
+_EVENT_ICONS = (
+    # Raid-related events
+    (('raid hour',), '⏰'),  # Clock for raid hour
+    (('raid day', 'raid weekend'), '🎯'),  # Target for special raid days
+    (('mega raid',), '💫'),  # Sparkles for mega raids
+    (('in 1-star', 'in 2-star', 'in 3-star', 'in 4-star', 'in 5-star', 'in 6-star',
+      'raid battles'), '⚔️'),  # Swords for raid battles (all tiers)
+    # Max/Dynamax battles
+    (('max battle', 'max monday', 'dynamax', 'gigantamax'), '⭐'),  # Star for max battles
+    (('spotlight hour',), '🔦'),  # Flashlight for spotlight hour
+    (('community day',), '👥'),  # People for community day
+    (('go battle', 'battle league', 'pvp'), '🥊'),  # Boxing glove for battles
+    # Special events / festivals
+    (('festival', 'celebration'), '🎉'),  # Party popper for festivals
+    (('halloween',), '🎃'),  # Pumpkin for Halloween
+    (('go pass',), '🎫'),  # Ticket for GO Pass
+    (('wild area', 'safari'), '🗺️'),  # Map for wild area events
+    (('season', 'tales of transformation'), '🌍'),  # Globe for seasons
+    (('trade',), '🤝'),  # Handshake for trade events
+    (('showcase',), '📸'),  # Camera for PokéStop showcases
+    (('research',), '🔍'),  # Magnifying glass for (timed) research
+)
+# The same rules as flat (keyword, icon) pairs, in priority order
+_EVENT_ICON_KEYWORDS = tuple(
+    (keyword, icon) for keywords, icon in _EVENT_ICONS for keyword in keywords
+)
+
+# Bump when the detail page parsing changes, so parsed details cached by
+# earlier versions are discarded
+_DETAILS_CACHE_VERSION = 4
+
+
+def _first_matching(nodes, selector: str):
+    """Return the first of the nodes matching a simple 'tag' or 'tag.class' selector, or None"""
+    tag, _, class_name = selector.partition('.')
+    for node in nodes:
+        if node.tag == tag and (not class_name or class_name in (node.attributes.get('class') or '').split()):
+            return node
+    return None
+
+
+def _escape_text(value: str) -> str:
+    """Escape an iCalendar TEXT value (RFC 5545, section 3.3.11)"""
+    return (
+        value.replace('\\', '\\\\')
+        .replace(';', '\\;')
+        .replace(',', '\\,')
+        .replace('\r\n', '\\n')
+        .replace('\n', '\\n')
+    )
+
+
+def _fold_line(line: str, limit: int = 75) -> str:
+    """Fold an iCalendar content line into lines of less than `limit` octets (RFC 5545, section 3.1)"""
+    if line.isascii():
+        return '\r\n '.join(line[i:i + limit - 1] for i in range(0, len(line), limit - 1))
+
+    chars = []
+    byte_count = 0
+    for char in line:
+        char_len = len(char.encode('utf-8'))
+        byte_count += char_len
+        if byte_count >= limit:
+            chars.append('\r\n ')
+            byte_count = char_len
+        chars.append(char)
+    return ''.join(chars)
+
+
+def _encode_lines(lines: List[str]) -> bytes:
+    """Fold and encode iCalendar content lines, each terminated by CRLF"""
+    return ''.join(_fold_line(line) + '\r\n' for line in lines).encode('utf-8')
+
+
+def _format_duration(delta: timedelta) -> str:
+    """Format a timedelta as an iCalendar DURATION value, e.g. "-PT2H" or "P3DT15H" """
+    sign = ''
+    if delta.days < 0:
+        sign = '-'
+        delta = -delta
+    time_part = ''
+    if delta.seconds:
+        hours, rest = divmod(delta.seconds, 3600)
+        minutes, seconds = divmod(rest, 60)
+        time_part = 'T'
+        if hours:
+            time_part += f'{hours}H'
+        if minutes or (hours and seconds):
+            time_part += f'{minutes}M'
+        if seconds:
+            time_part += f'{seconds}S'
+    if delta.days == 0 and time_part:
+        return f'{sign}P{time_part}'
+    return f'{sign}P{delta.days}D{time_part}'
+
+
+@lru_cache(maxsize=512)
+def _parse_datetime_cached(date_str: str, prefer_future: bool, now: datetime, tz: ZoneInfo) -> Optional[datetime]:
+    """
+    Parse date string from LeekDuck format (see LeekDuckScraper.parse_datetime)
+    Cached, as the same dates (e.g. season start/end) recur across event pages
+    """
+    # Remove "Local Time" and clean up
+    date_str = date_str.replace('Local Time', '').strip()
+
+    # Try full format with year first: "Monday, October 13, 2025, at 6:00 PM"
+    match = _DATE_WITH_YEAR_RE.search(date_str)
+
+    if match:
+        day_name, month_name, day, year, hour, minute, ampm = match.groups()
+        month = _MONTHS.get(month_name.lower())
+        if not month:
+            return None
+        hour = int(hour) % 12 + (12 if ampm == 'PM' else 0)
+        return datetime(int(year), month, int(day), hour, int(minute), tzinfo=tz)
+
+    # Try short format without year: "Mon, Oct 13, at 7:00 PM"
+    match = _DATE_SHORT_RE.search(date_str)
+
+    if not match:
+        return None
+
+    day_name, month_name, day, hour, minute, ampm = match.groups()
+    month = _MONTHS.get(month_name.lower())
+    if not month:
+        return None
+    hour = int(hour) % 12 + (12 if ampm == 'PM' else 0)
+
+    # Get current year (or next year if date has passed)
+    current_year = now.year
+
+    # Build the date in the calendar timezone
+    localized_date = datetime(current_year, month, int(day), hour, int(minute), tzinfo=tz)
+
+    # If the date is in the past and we prefer future dates, assume it's next year
+    if prefer_future and localized_date < now:
+        localized_date = localized_date.replace(year=current_year + 1)
+
+    return localized_date
 
 
 class LeekDuckScraper:
@@ -19,283 +239,370 @@ class LeekDuckScraper:
 
     def __init__(self):
         self.url = "https://leekduck.com/events/"
-        self.timezone = pytz.timezone('Europe/Brussels')
+        self.timezone = ZoneInfo('Europe/Brussels')
+        # Reference time for a run, refreshed by scrape_events/create_ical
+        self._now = datetime.now(self.timezone)
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         }
+        # Number of detail pages requested concurrently (also caps load on the server)
+        self.max_concurrent_requests = 12
+        self.timeout = httpx.Timeout(30.0)
+
+        # Parsed event details keyed by URL, revalidated with the page's
+        # ETag/Last-Modified so unchanged pages come back as 304s
+        self.details_cache_file = 'leekduck_details.json'
+        self.details_cache = {}
+
+    def create_client(self) -> httpx.AsyncClient:
+        """Create the HTTP/2 client shared by all requests of a scrape"""
+        return httpx.AsyncClient(
+            http2=True,
+            headers=self.headers,
+            timeout=self.timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=self.max_concurrent_requests,
+                max_connections=self.max_concurrent_requests
+            )
+        )
 
-    def fetch_page(self) -> str:
+    async def fetch_page(self, client: httpx.AsyncClient) -> bytes:
         """Fetch the LeekDuck events page"""
-        response = requests.get(self.url, headers=self.headers)
+        response = await client.get(self.url)
         response.raise_for_status()
-        return response.text
+        return response.content
 
-    def parse_datetime(self, date_str: str, prefer_future: bool = True) -> Optional[datetime]:
+    def parse_datetime(self, date_str: str, prefer_future: bool = True,
+                       now: Optional[datetime] = None) -> Optional[datetime]:
         """
         Parse date string from LeekDuck format
         Examples: "Mon, Oct 13, at 7:00 PM Local Time"
                   "Tue, Oct 14, at 10:00 AM Local Time"
                   "Monday, October 13, 2025, at 6:00 PM Local Time"
                   "Tuesday, October 7, 2025, at 10:00 AM Local Time"
+        Dates without a year are resolved relative to `now` (the run's
+        reference time by default)
         """
         if not date_str:
             return None
 
-        # Remove "Local Time" and clean up
-        date_str = date_str.replace('Local Time', '').strip()
-
-        # Try full format with year first: "Monday, October 13, 2025, at 6:00 PM"
-        pattern_with_year = r'(\w+),\s+(\w+)\s+(\d+),\s+(\d{4}),\s+at\s+(\d+):(\d+)\s+(AM|PM)'
-        match = re.search(pattern_with_year, date_str)
-
-        if match:
-            day_name, month_name, day, year, hour, minute, ampm = match.groups()
-            date_string = f"{month_name} {day} {year} {hour}:{minute} {ampm}"
-            parsed_date = datetime.strptime(date_string, "%B %d %Y %I:%M %p")
-            return self.timezone.localize(parsed_date)
-
-        # Try short format without year: "Mon, Oct 13, at 7:00 PM"
-        pattern = r'(\w+),\s+(\w+)\s+(\d+),\s+at\s+(\d+):(\d+)\s+(AM|PM)'
-        match = re.search(pattern, date_str)
-
-        if not match:
-            return None
-
-        day_name, month_name, day, hour, minute, ampm = match.groups()
+        if now is None:
+            now = self._now
+        return _parse_datetime_cached(date_str, prefer_future, now, self.timezone)
 
-        # Get current year (or next year if date has passed)
-        current_year = datetime.now().year
-
-        # Parse the date
-        date_string = f"{month_name} {day} {current_year} {hour}:{minute} {ampm}"
-        parsed_date = datetime.strptime(date_string, "%b %d %Y %I:%M %p")
-
-        # Localize to Brussels timezone
-        localized_date = self.timezone.localize(parsed_date)
-
-        # If the date is in the past and we prefer future dates, assume it's next year
-        if prefer_future and localized_date < datetime.now(self.timezone):
-            parsed_date = datetime.strptime(
-                f"{month_name} {day} {current_year + 1} {hour}:{minute} {ampm}",
-                "%b %d %Y %I:%M %p"
-            )
-            localized_date = self.timezone.localize(parsed_date)
-
-        return localized_date
-
-    def fetch_event_details(self, event_url: str) -> Dict[str, any]:
+    def extract_dates(self, text: str) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """
+        Find the start and end date in the text of an event detail page
+        Looks for text patterns like "Tuesday, October 7, 2025, at 10:00 AM Local Time"
+        """
+        start = None
+        end = None
+        dates = None
+
+        # Extract start date
+        # Use the "Starts:" or "Start:" date, otherwise the first date that
+        # looks like a start date
+        start_match = _START_DATE_RE.search(text)
+        if start_match:
+            start = self.parse_datetime(start_match.group(1), prefer_future=False)
+        else:
+            dates = _LOCAL_DATE_RE.findall(text)
+            if dates:
+                start = self.parse_datetime(dates[0], prefer_future=False)
+
+        # Extract end date
+        end_match = _END_DATE_RE.search(text)
+        if end_match:
+            # "Ends:" or "End:" date
+            end = self.parse_datetime(end_match.group(1), prefer_future=False)
+        else:
+            range_match = _DATE_RANGE_RE.search(text)
+            if range_match:
+                # "from DATE to DATE at TIME" with full dates
+                end_date_str = f"{range_match.group(1)}, at {range_match.group(2)} Local Time"
+                end = self.parse_datetime(end_date_str, prefer_future=False)
+            else:
+                range_no_time_match = _DATE_RANGE_NO_TIME_RE.search(text)
+                if range_no_time_match and start:
+                    # "from Month Day, Year to Month Day, Year" (no time)
+                    # Use same time as start date
+                    end_date = range_no_time_match.group(2)
+                    start_time = start.strftime('%I:%M %p')
+                    end_date_str = f"Monday, {end_date}, at {start_time} Local Time"
+                    end = self.parse_datetime(end_date_str, prefer_future=False)
+                else:
+                    if dates is None:
+                        dates = _LOCAL_DATE_RE.findall(text)
+                    if len(dates) >= 2:
+                        # If we found multiple dates, assume last one is end date
+                        end = self.parse_datetime(dates[-1], prefer_future=False)
+
+        return start, end
+
+        range_match = _DATE_RANGE_RE.search(text)
+        if range_match:
+            # "from DATE to DATE at TIME" with full dates
+            end_date_str = f"{range_match.group(1)}, at {range_match.group(2)} Local Time"
+            end = self.parse_datetime(end_date_str, prefer_future=False)
+            return start, end
+
+        range_no_time_match = _DATE_RANGE_NO_TIME_RE.search(text)
+        if range_no_time_match and start:
+            # "from Month Day, Year to Month Day, Year" (no time)
+            # Use same time as start date
+            end_date = range_no_time_match.group(2)
+            start_time = start.strftime('%I:%M %p')
+            end_date_str = f"Monday, {end_date}, at {start_time} Local Time"
+            end = self.parse_datetime(end_date_str, prefer_future=False)
+            return start, end
+
+        if dates is None:
+            dates = _LOCAL_DATE_RE.findall(text)
+        if len(dates) >= 2:
+            # If we found multiple dates, assume last one is end date
+            end = self.parse_datetime(dates[-1], prefer_future=False)
+
+        return start, end
+
+    async def fetch_event_details(self, client: httpx.AsyncClient, event_url: str) -> Dict[str, any]:
         """
         Fetch detailed information from an event's detail page
         Returns dict with 'title', 'start', 'end', and 'description'
         """
         try:
-            # Add delay to be respectful to the server
-            time.sleep(0.5)
-
-            response = requests.get(event_url, headers=self.headers)
+            # Revalidate the page parsed on a previous run, if any
+            cached = self.details_cache.get(event_url)
+            request_headers = {}
+            if cached:
+                if cached['etag']:
+                    request_headers['If-None-Match'] = cached['etag']
+                if cached['last_modified']:
+                    request_headers['If-Modified-Since'] = cached['last_modified']
+
+            response = await client.get(event_url, headers=request_headers)
+
+            # Skip parsing if the page hasn't changed since it was last parsed
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if cached and (response.status_code == 304 or (
+                    (etag or last_modified)
+                    and (etag, last_modified) == (cached['etag'], cached['last_modified']))):
+                return {
+                    'title': cached['title'],
+                    'start': self._load_datetime(cached['start']),
+                    'end': self._load_datetime(cached['end']),
+                    'description': cached['description']
+                }
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            details = {
-                'title': '',
-                'start': None,
-                'end': None,
-                'description': ''
-            }
-
-            # Extract title from page
-            title_elem = soup.find('h1')
-            if not title_elem:
-                title_elem = soup.find('title')
-            if title_elem:
-                title_text = title_elem.get_text(strip=True)
-                # Clean up title - remove " - Leek Duck" suffix and other common suffixes
-                title_text = re.sub(r'\s*-\s*Leek Duck.*$', '', title_text)
-                title_text = re.sub(r'\s*\|\s*Pokémon GO.*$', '', title_text)
-                details['title'] = title_text
-
-            # Find date/time information
-            # Look for text patterns like "Tuesday, October 7, 2025, at 10:00 AM Local Time"
-            text_content = soup.get_text()
-
-            # Extract start date
-            # Look for "Starts:" or "Start:" pattern (use \s+ to handle variable whitespace)
-            start_pattern = r'Starts?:\s+([A-Za-z]+,\s+[A-Za-z]+\s+\d+,\s+\d{4},\s+at\s+\d+:\d+\s+[AP]M\s+Local\s+Time)'
-            start_match = re.search(start_pattern, text_content, re.IGNORECASE)
-            if start_match:
-                details['start'] = self.parse_datetime(start_match.group(1), prefer_future=False)
-            else:
-                # Try to find any date that looks like a start date
-                date_pattern = r'([A-Za-z]+,\s+[A-Za-z]+\s+\d+,\s+\d{4},\s+at\s+\d+:\d+\s+[AP]M)\s+Local\s+Time'
-                dates = re.findall(date_pattern, text_content)
-                if dates and len(dates) >= 1:
-                    details['start'] = self.parse_datetime(dates[0], prefer_future=False)
-
-            # Extract end date
-            # Look for "Ends:" or "End:" pattern (use \s+ to handle variable whitespace)
-            end_pattern = r'Ends?:\s+([A-Za-z]+,\s+[A-Za-z]+\s+\d+,\s+\d{4},\s+at\s+\d+:\d+\s+[AP]M\s+Local\s+Time)'
-            end_match = re.search(end_pattern, text_content, re.IGNORECASE)
-            if end_match:
-                details['end'] = self.parse_datetime(end_match.group(1), prefer_future=False)
-            else:
-                # Look for pattern "from DATE to DATE at TIME" with full dates
-                date_range_pattern1 = r'from\s+[A-Za-z]+,\s+[A-Za-z]+\s+\d+,\s+\d{4}\s+to\s+([A-Za-z]+,\s+[A-Za-z]+\s+\d+,\s+\d{4}),?\s+at\s+(\d+:\d+\s+[AP]M)'
-                range_match = re.search(date_range_pattern1, text_content, re.IGNORECASE)
-                if range_match:
-                    end_date_str = f"{range_match.group(1)}, at {range_match.group(2)} Local Time"
-                    details['end'] = self.parse_datetime(end_date_str, prefer_future=False)
-                else:
-                    # Look for pattern "from Month Day, Year to Month Day, Year" (no time)
-                    date_range_pattern2 = r'from\s+([A-Za-z]+\s+\d+,\s+\d{4})\s+to\s+([A-Za-z]+\s+\d+,\s+\d{4})'
-                    range_match2 = re.search(date_range_pattern2, text_content, re.IGNORECASE)
-                    if range_match2 and details['start']:
-                        # Use same time as start date
-                        end_date = range_match2.group(2)
-                        start_time = details['start'].strftime('%I:%M %p')
-                        end_date_str = f"Monday, {end_date}, at {start_time} Local Time"
-                        details['end'] = self.parse_datetime(end_date_str, prefer_future=False)
-                    elif dates and len(dates) >= 2:
-                        # If we found multiple dates, assume last one is end date
-                        details['end'] = self.parse_datetime(dates[-1], prefer_future=False)
-
-            # Extract description from main content area
-            # Try different selectors for description
-            desc_selectors = [
-                'div.entry-content',
-                'div.event-description',
-                'div.content',
-                'article',
-                'main'
-            ]
 
-            for selector in desc_selectors:
-                desc_elem = soup.select_one(selector)
-                if desc_elem:
-                    # Get text but clean it up
-                    paragraphs = desc_elem.find_all('p')
-                    if paragraphs:
-                        desc_parts = []
-                        for p in paragraphs:
-                            text = p.get_text(strip=True)
-                            # Skip empty paragraphs and navigation elements
-                            if text and len(text) > 20 and 'cookie' not in text.lower():
-                                desc_parts.append(text)
-                        details['description'] = '\n\n'.join(desc_parts[:5])  # Limit to first 5 paragraphs
-                        break
+            details = self.parse_event_details(response.content)
+
+            if etag or last_modified:
+                self.details_cache[event_url] = {
+                    'etag': etag,
+                    'last_modified': last_modified,
+                    'title': details['title'],
+                    'start': details['start'].isoformat() if details['start'] else None,
+                    'end': details['end'].isoformat() if details['end'] else None,
+                    'description': details['description']
+                }
 
             return details
 
         except Exception as e:
-            print(f"Error fetching event details from {event_url}: {e}")
+            logger.warning("Error fetching event details from %s: %s", event_url, e)
             return {'title': '', 'start': None, 'end': None, 'description': ''}
 
-    def get_event_icon(self, title: str) -> str:
+    def parse_event_details(self, html: bytes) -> Dict[str, any]:
+        """
+        Parse an event's detail page
+        Returns dict with 'title', 'start', 'end', and 'description'
+        """
+        # Parse the raw bytes: LeekDuck serves UTF-8, so this skips the
+        # charset detection that response.text would run
+        tree = LexborHTMLParser(html)
+        # Drop subtrees whose text is never needed, so it isn't
+        # materialised and scanned for dates below
+        tree.strip_tags(['script', 'style', 'noscript', 'template'])
+
+        details = {
+            'title': '',
+            'start': None,
+            'end': None,
+            'description': ''
+        }
+
+        # Extract title from page
+        title_elem = tree.css_first('h1')
+        if not title_elem:
+            title_elem = tree.css_first('title')
+        if title_elem:
+            title_text = title_elem.text(strip=True)
+            # Clean up title - remove " - Leek Duck" suffix and other common suffixes
+            title_text = _TITLE_SUFFIX_RE.sub('', title_text, count=1)
+            details['title'] = title_text
+
+        # Find all main content containers in a single traversal
+        containers = tree.css(_CONTAINERS_SELECTOR)
+
+        # Find date/time information
+        # Dates are normally in the main content, so only scan its text
+        # rather than the whole page (navigation, footer, ...). Fall back
+        # to the whole page if no start date is found there.
+        content = None
+        for selector in _DATES_SELECTORS:
+            content = _first_matching(containers, selector)
+            if content:
+                break
+        if content:
+            details['start'], details['end'] = self.extract_dates(content.text(separator=' '))
+        if not details['start']:
+            details['start'], details['end'] = self.extract_dates(tree.body.text(separator=' '))
+
+        # Extract description from main content area
+        # Use the first container (in selector order) that has paragraphs
+        for selector in _DESCRIPTION_SELECTORS:
+            desc_elem = _first_matching(containers, selector)
+            if desc_elem:
+                # Get text but clean it up
+                paragraphs = desc_elem.css('p')
+                if paragraphs:
+                    desc_parts = []
+                    for p in paragraphs:
+                        text = p.text(strip=True)
+                        # Skip empty paragraphs and navigation elements
+                        if text and len(text) > 20 and 'cookie' not in text.lower():
+                            desc_parts.append(text)
+                            if len(desc_parts) == 5:  # Limit to first 5 paragraphs
+                                break
+                    details['description'] = '\n\n'.join(desc_parts)
+                    break
+
+        return details
+
+    def _load_datetime(self, value: Optional[str]) -> Optional[datetime]:
+        """Restore a cached ISO datetime in the calendar timezone"""
+        if not value:
+            return None
+        return datetime.fromisoformat(value).astimezone(self.timezone)
+
+    def load_details_cache(self):
+        """Load parsed event details saved by a previous run"""
+        try:
+            with open(self.details_cache_file, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        if data.get('version') == _DETAILS_CACHE_VERSION:
+            self.details_cache = data['events']
+        else:
+            self.details_cache = {}
+
+    def save_details_cache(self):
+        """Save parsed event details for the next run"""
+        with open(self.details_cache_file, 'w', encoding='utf-8') as f:
+            json.dump({'version': _DETAILS_CACHE_VERSION, 'events': self.details_cache}, f, ensure_ascii=False)
+
+    def get_event_icon(self, title_lower: str) -> str:
         """
         Determine event type and return appropriate emoji icon
+        Expects the title already lowercased (casefolded)
         """
-        title_lower = title.lower()
-
-        # Raid-related events (order matters - most specific first)
-        if 'raid hour' in title_lower:
-            return '⏰'  # Clock for raid hour
-        if 'raid day' in title_lower or 'raid weekend' in title_lower:
-            return '🎯'  # Target for special raid days
-        if 'mega raid' in title_lower or 'in mega raids' in title_lower:
-            return '💫'  # Sparkles for mega raids
-        if any(tier in title_lower for tier in ['in 1-star', 'in 2-star', 'in 3-star', 'in 4-star', 'in 5-star', 'in 6-star', 'raid battles']):
-            return '⚔️'  # Swords for raid battles (all tiers)
-
-        # Max/Dynamax battles
-        if 'max battle' in title_lower or 'max monday' in title_lower or 'dynamax' in title_lower or 'gigantamax' in title_lower:
-            return '⭐'  # Star for max battles
-
-        # Spotlight hours
-        if 'spotlight hour' in title_lower:
-            return '🔦'  # Flashlight for spotlight hour
-
-        # Community events
-        if 'community day' in title_lower:
-            return '👥'  # People for community day
-
-        # GO Battle League / PvP
-        if 'go battle' in title_lower or 'battle league' in title_lower or 'pvp' in title_lower:
-            return '🥊'  # Boxing glove for battles
-
-        # Special events / festivals
-        if 'festival' in title_lower or 'celebration' in title_lower:
-            return '🎉'  # Party popper for festivals
-        if 'halloween' in title_lower:
-            return '🎃'  # Pumpkin for Halloween
-
-        # GO Pass
-        if 'go pass' in title_lower:
-            return '🎫'  # Ticket for GO Pass
-
-        # Wild Area / Safari
-        if 'wild area' in title_lower or 'safari' in title_lower:
-            return '🗺️'  # Map for wild area events
-
-        # Season
-        if 'season' in title_lower or 'tales of transformation' in title_lower:
-            return '🌍'  # Globe for seasons
-
-        # Trade events
-        if 'trade' in title_lower:
-            return '🤝'  # Handshake for trade events
-
-        # PokéStop Showcase
-        if 'showcase' in title_lower:
-            return '📸'  # Camera for showcases
-
-        # Research / Timed Research
-        if 'research' in title_lower:
-            return '🔍'  # Magnifying glass for research
-
-        # Default event icon
+        for keyword, icon in _EVENT_ICON_KEYWORDS:
+            if keyword in title_lower:
+                return icon
         return '📅'  # Calendar for general events
 
+    def extract_event_links(self, html: bytes) -> Dict[str, str]:
+        """
+        Find the event detail pages linked from the listing page
+        Returns dict mapping each detail URL to a fallback title, in listing order
+        """
+        # LeekDuck structure: Find all links that point to /events/[event-name]/
+        # These are the event detail pages. Most events are linked several
+        # times (image, title, ...), so keep only the first link per URL.
+        # The listing is machine-generated, so a regex over the raw HTML
+        # finds the links without parsing the whole page.
+        fallback_titles = {}
+        for match in _LISTING_LINK_RE.finditer(html):
+            href = match['href']
+            if href is None:
+                continue
+            href = href.decode('utf-8', 'replace')
+            detail_url = f"https://leekduck.com{href}"
+            if _EVENT_HREF_RE.match(href) and detail_url not in fallback_titles:
+                # Link text, as text(strip=True) would give it below
+                title_text = ''.join(
+                    html_lib.unescape(part).strip()
+                    for part in _TAG_RE.split(match['text'].decode('utf-8', 'replace'))
+                )
+                fallback_titles[detail_url] = title_text.split('\n')[0] if '\n' in title_text else title_text
+        if fallback_titles:
+            return fallback_titles
+
+        # Fall back to parsing the page in case the markup changed
+        tree = LexborHTMLParser(html)
+        event_links = {}
+        for link in tree.css('a[href]'):
+            href = link.attributes.get('href') or ''
+            if _EVENT_HREF_RE.match(href):
+                event_links.setdefault(f"https://leekduck.com{href}", link)
+
+        # Extract titles from link text (fallback)
+        fallback_titles = {}
+        for detail_url, link in event_links.items():
+            title_text = link.text(strip=True)
+            fallback_titles[detail_url] = title_text.split('\n')[0] if '\n' in title_text else title_text
+        return fallback_titles
+
     def scrape_events(self) -> List[Dict]:
         """Scrape all events from LeekDuck"""
-        html = self.fetch_page()
-        soup = BeautifulSoup(html, 'html.parser')
+        return asyncio.run(self.scrape_events_async())
+
+    async def scrape_events_async(self) -> List[Dict]:
+        """Scrape all events from LeekDuck, fetching pages concurrently over HTTP/2"""
+        self._now = datetime.now(self.timezone)
+        self.load_details_cache()
         events = []
-        seen_urls = set()  # Track URLs to avoid duplicates
 
-        # LeekDuck structure: Find all links that point to /events/[event-name]/
-        # These are the event detail pages
-        all_links = soup.find_all('a', href=True)
-        event_links = [
-            a for a in all_links
-            if a.get('href', '').startswith('/events/')
-            and a.get('href') != '/events/'
-            and len(a.get('href')) > 10  # Filter out short/invalid links
-        ]
-
-        print(f"Found {len(event_links)} potential event links")
-
-        for link in event_links:
-            try:
-                href = link.get('href')
-                detail_url = f"https://leekduck.com{href}"
+        async with self.create_client() as client:
+            html = await self.fetch_page(client)
 
-                # Skip if we've already processed this URL
-                if detail_url in seen_urls:
-                    continue
-                seen_urls.add(detail_url)
+            fallback_titles = self.extract_event_links(html)
+            logger.info("Found %d event links", len(fallback_titles))
+
+            # Fetch detailed information from detail pages concurrently
+            semaphore = asyncio.Semaphore(self.max_concurrent_requests)
 
-                # Extract title from link text (fallback)
-                title_text = link.get_text(strip=True)
-                fallback_title = title_text.split('\n')[0] if '\n' in title_text else title_text
+            async def fetch(detail_url: str, fallback_title: str) -> Dict[str, any]:
+                async with semaphore:
+                    logger.debug("  Fetching: %s...", fallback_title[:50])
+                    return await self.fetch_event_details(client, detail_url)
 
-                # Fetch detailed information from detail page
-                print(f"  Fetching: {fallback_title[:50]}...")
-                details = self.fetch_event_details(detail_url)
+            results = await asyncio.gather(*(
+                fetch(detail_url, fallback_title)
+                for detail_url, fallback_title in fallback_titles.items()
+            ))
+        details_by_url = dict(zip(fallback_titles, results))
+
+        # Only keep details for events still listed
+        self.details_cache = {
+            url: cached for url, cached in self.details_cache.items()
+            if url in details_by_url
+        }
+        self.save_details_cache()
+
+        for detail_url, fallback_title in fallback_titles.items():
+            try:
+                details = details_by_url[detail_url]
 
                 # Use title from detail page if available, otherwise use fallback
                 title = details['title'] if details['title'] else fallback_title
+                title_lower = title.casefold()
 
                 # Add icon to title
-                icon = self.get_event_icon(title)
+                icon = self.get_event_icon(title_lower)
                 title_with_icon = f"{icon} {title}"
 
                 # Use detailed info
@@ -305,7 +612,7 @@ class LeekDuckScraper:
 
                 # If we couldn't get dates from detail page, skip this event
                 if not event_start:
-                    print(f"    Skipping (no start date found)")
+                    logger.info("    Skipping %s (no start date found)", detail_url)
                     continue
 
                 # If we still don't have an end time, default to 1 hour after start
@@ -322,27 +629,31 @@ class LeekDuckScraper:
                 })
 
             except Exception as e:
-                print(f"Error parsing event {detail_url}: {e}")
+                logger.warning("Error parsing event %s: %s", detail_url, e)
                 continue
 
         return events
 
-    def create_ical(self, events: List[Dict]) -> Calendar:
-        """Create iCalendar object from events"""
-        cal = Calendar()
-        cal.add('prodid', '-//LeekDuck Events Calendar//EN')
-        cal.add('version', '2.0')
-        cal.add('x-wr-calname', 'LeekDuck Pokemon GO Events')
-        cal.add('x-wr-timezone', 'Europe/Brussels')
-        cal.add('x-wr-caldesc', 'Pokemon GO events from LeekDuck.com')
+    def create_ical(self, events: List[Dict]) -> bytes:
+        """Create iCalendar file contents from events"""
+        return b''.join(self.iter_ical(events))
+
+    def iter_ical(self, events: List[Dict]) -> Iterator[bytes]:
+        """Yield iCalendar file contents for events, one component at a time"""
+        self._now = datetime.now(self.timezone)
+        tzid = self.timezone.key
+        dtstamp = self._now.astimezone(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+
+        yield _encode_lines([
+            'BEGIN:VCALENDAR',
+            'VERSION:2.0',
+            'PRODID:-//LeekDuck Events Calendar//EN',
+            'X-WR-CALDESC:Pokemon GO events from LeekDuck.com',
+            'X-WR-CALNAME:LeekDuck Pokemon GO Events',
+            f'X-WR-TIMEZONE:{tzid}',
+        ])
 
         for event_data in events:
-            event = Event()
-            event.add('summary', event_data['title'])
-            event.add('dtstart', event_data['start'])
-            event.add('dtend', event_data['end'])
-            event.add('dtstamp', datetime.now(self.timezone))
-
             # Create description with full details
             description = event_data['description']
             if event_data.get('url') and event_data['url'] != self.url:
@@ -351,78 +662,95 @@ class LeekDuckScraper:
                 description += f"\n\nImage: {event_data['image_url']}"
             description += f"\n\nData from LeekDuck.com"
 
-            event.add('description', description)
-            event.add('location', 'Pokemon GO')
+            # Stable across runs (unlike hash(), which is randomised per process)
+            # so calendar clients recognise events they have already synced
+            uid_hash = hashlib.blake2b(event_data['title'].encode('utf-8'), digest_size=8).hexdigest()
+
+            lines = [
+                'BEGIN:VEVENT',
+                f"SUMMARY:{_escape_text(event_data['title'])}",
+                f"DTSTART;TZID={tzid}:{event_data['start']:%Y%m%dT%H%M%S}",
+                f"DTEND;TZID={tzid}:{event_data['end']:%Y%m%dT%H%M%S}",
+                f"DTSTAMP:{dtstamp}",
+                f"UID:{event_data['start'].isoformat()}-{uid_hash}@leekduck-calendar",
+                f"DESCRIPTION:{_escape_text(description)}",
+                'LOCATION:Pokemon GO',
+            ]
 
             # Add URL if available
             if event_data.get('url'):
-                event.add('url', event_data['url'])
-
-            event.add('uid', f"{event_data['start'].isoformat()}-{hash(event_data['title'])}@leekduck-calendar")
+                lines.append(f"URL:{event_data['url']}")
 
             # Add alarms/alerts
             # Alarm 1: 2 hours before event starts
-            alarm_before = Alarm()
-            alarm_before.add('action', 'DISPLAY')
-            alarm_before.add('description', f"Reminder: {event_data['title']} starts in 2 hours")
-            alarm_before.add('trigger', timedelta(hours=-2))
-            event.add_component(alarm_before)
+            lines += [
+                'BEGIN:VALARM',
+                'ACTION:DISPLAY',
+                'DESCRIPTION:' + _escape_text(f"Reminder: {event_data['title']} starts in 2 hours"),
+                f"TRIGGER:{_format_duration(timedelta(hours=-2))}",
+                'END:VALARM',
+            ]
 
             # Alarm 2: 9:00 AM on the day the event ends
             # Calculate the trigger time: 9:00 AM on end date minus the event start time
             end_date = event_data['end']
-            morning_of_end = self.timezone.localize(datetime(
-                end_date.year, end_date.month, end_date.day, 9, 0, 0
-            ))
+            morning_of_end = datetime(
+                end_date.year, end_date.month, end_date.day, 9, 0, 0,
+                tzinfo=self.timezone
+            )
             # Calculate offset from event start
             trigger_delta = morning_of_end - event_data['start']
 
             # Only add this alarm if it's positive (i.e., event doesn't end before 9 AM on end day)
             # and if it's different from the first alarm
             if trigger_delta.total_seconds() > 0 and abs(trigger_delta.total_seconds() - (-2*3600)) > 3600:
-                alarm_end = Alarm()
-                alarm_end.add('action', 'DISPLAY')
-                alarm_end.add('description', f"Reminder: {event_data['title']} ends today")
-                alarm_end.add('trigger', trigger_delta)
-                event.add_component(alarm_end)
+                lines += [
+                    'BEGIN:VALARM',
+                    'ACTION:DISPLAY',
+                    'DESCRIPTION:' + _escape_text(f"Reminder: {event_data['title']} ends today"),
+                    f"TRIGGER:{_format_duration(trigger_delta)}",
+                    'END:VALARM',
+                ]
 
-            cal.add_component(event)
+            lines.append('END:VEVENT')
+            yield _encode_lines(lines)
 
-        return cal
+        yield _encode_lines(['END:VCALENDAR'])
 
-    def save_ical(self, cal: Calendar, filename: str = 'events.ics'):
-        """Save iCalendar to file"""
-        with open(filename, 'wb') as f:
-            f.write(cal.to_ical())
-        print(f"Calendar saved to {filename}")
+    def save_ical(self, events: List[Dict], filename: str = 'events.ics'):
+        """Save iCalendar for events to file, writing it one event at a time"""
+        with open(filename, 'wb', buffering=1 << 16) as f:
+            f.writelines(self.iter_ical(events))
+        logger.info("Calendar saved to %s", filename)
 
 
 def main():
     """Main execution function"""
-    print("Scraping LeekDuck events...")
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    # httpx logs every request at INFO; keep the output to one line per run step
+    for name in ('httpx', 'httpcore'):
+        logging.getLogger(name).setLevel(logging.WARNING)
+    logger.info("Scraping LeekDuck events...")
 
     scraper = LeekDuckScraper()
 
     # Scrape events
-    events = scraper.scrape_events()
-    print(f"Found {len(events)} events")
-
-    # Print events for debugging
-    for event in events:
-        start_str = event['start'].strftime('%Y-%m-%d %H:%M %Z')
-        end_str = event['end'].strftime('%Y-%m-%d %H:%M %Z')
-        duration = event['end'] - event['start']
-        duration_str = f"{duration.days}d {duration.seconds//3600}h" if duration.days > 0 else f"{duration.seconds//3600}h {(duration.seconds//60)%60}m"
-        print(f"  - {event['title']}")
-        print(f"    {start_str} -> {end_str} ({duration_str})")
-
-    # Create iCalendar
-    cal = scraper.create_ical(events)
-
-    # Save to file
-    scraper.save_ical(cal)
-
-    print("Done! Calendar file generated successfully.")
+    events = asyncio.run(scraper.scrape_events_async())
+    logger.info("Found %d events", len(events))
+
+    # Log events for debugging
+    if logger.isEnabledFor(logging.INFO):
+        for event in events:
+            start_str = event['start'].strftime('%Y-%m-%d %H:%M %Z')
+            end_str = event['end'].strftime('%Y-%m-%d %H:%M %Z')
+            duration = event['end'] - event['start']
+            duration_str = f"{duration.days}d {duration.seconds//3600}h" if duration.days > 0 else f"{duration.seconds//3600}h {(duration.seconds//60)%60}m"
+            logger.info("  - %s\n    %s -> %s (%s)", event['title'], start_str, end_str, duration_str)
+
+    # Create iCalendar and save to file
+    scraper.save_ical(events)
+
+    logger.info("Done! Calendar file generated successfully.")
 
 
 if __name__ == "__main__":